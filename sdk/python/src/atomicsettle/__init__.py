@@ -24,7 +24,7 @@ Example:
     >>> print(f"Settled in {settlement.duration_ms}ms")
 """
 
-from atomicsettle.client import AtomicSettleClient
+from atomicsettle.client import AtomicSettleClient, install_uvloop
 from atomicsettle.types import (
     Currency,
     Money,
@@ -47,6 +47,7 @@ __version__ = "0.1.0"
 __all__ = [
     # Client
     "AtomicSettleClient",
+    "install_uvloop",
     # Types
     "Currency",
     "Money",
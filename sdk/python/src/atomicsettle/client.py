@@ -3,14 +3,34 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import os
+import ssl
+import time
+import zlib
+from collections import OrderedDict
 from decimal import Decimal
-from typing import AsyncIterator, Callable, Optional
-from uuid import uuid4
+from functools import singledispatch
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+)
+from uuid import UUID
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 from atomicsettle.exceptions import (
     AtomicSettleError,
+    AuthenticationError,
     ConnectionError,
+    TimeoutError,
     ValidationError,
 )
 from atomicsettle.types import (
@@ -25,6 +45,284 @@ from atomicsettle.types import (
 
 logger = logging.getLogger(__name__)
 
+# Protocol version carried in every message envelope.
+_PROTOCOL_VERSION = "1.0"
+
+# Recreate a channel that has been idle longer than this (the coordinator's
+# load balancer drops idle connections after a few minutes).
+_CHANNEL_IDLE_TTL_S = 180.0
+
+# Recreate a channel before it hits HTTP/2's default 100-concurrent-stream
+# limit, where new RPCs would queue behind existing ones.
+_MAX_STREAMS_PER_CHANNEL = 90
+
+# Final settlements are immutable, so get_settlement answers for them from a
+# bounded LRU cache instead of re-querying the coordinator.
+_SETTLEMENT_CACHE_SIZE = 1024
+
+# Bound on the incoming-notification queues. When a burst arrives faster than
+# a stalled handler or subscriber drains it, the oldest notifications are
+# shed (and counted) instead of growing memory without limit; consumers can
+# recover anything missed via list_settlements.
+_DISPATCH_QUEUE_SIZE = 10_000
+
+# Exponential backoff bounds for reconnecting a broken settlement stream.
+_STREAM_BACKOFF_BASE_S = 0.5
+_STREAM_BACKOFF_MAX_S = 30.0
+_STREAM_RECONNECT_ATTEMPTS = 5
+
+
+class _Channel:
+    """
+    A single transport connection to the coordinator.
+
+    In a real implementation this wraps a grpc.aio.Channel built with the
+    client's TLS credentials; here it tracks the metadata the pool needs to
+    rotate and expire connections.
+    """
+
+    def __init__(self, target: str):
+        self.target = target
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+        self.active_streams = 0
+        self.stream: Optional[_SettlementStream] = None
+
+    async def close(self) -> None:
+        """Close the underlying connection."""
+        if self.stream is not None:
+            await self.stream.close()
+            self.stream = None
+        # In a real implementation: await self._grpc_channel.close()
+
+
+class _StreamRpc(Protocol):
+    """Bidirectional stream call as the transport exposes it (grpc.aio style)."""
+
+    async def read(self) -> Settlement: ...
+
+    async def write(self, requests: list[SettlementRequest]) -> None: ...
+
+
+class _SettlementStream:
+    """
+    Long-lived bidirectional SettlementStream RPC over one pooled channel.
+
+    Opening a fresh HTTP/2 stream per RPC costs a HEADERS + DATA + RST_STREAM
+    exchange on every call; instead, requests are written as frames onto one
+    persistent stream and responses are demultiplexed by idempotency_key.
+    The same stream carries coordinator-initiated push frames for incoming
+    settlement notifications.
+    """
+
+    def __init__(self, client: AtomicSettleClient, channel: _Channel):
+        self._client = client
+        self._channel = channel
+        self._rpc: Optional[_StreamRpc] = None
+        self._reader_task: Optional[asyncio.Task[None]] = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """Check if this stream has been closed or given up reconnecting."""
+        return self._closed
+
+    async def open(self) -> None:
+        """Open the stream RPC and start the response reader."""
+        self._rpc = await self._client._open_stream(self._channel)
+        self._channel.active_streams += 1
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def send_requests(self, requests: list[SettlementRequest]) -> None:
+        """Write a batch of settlement requests as one stream frame."""
+        assert self._rpc is not None
+        # In a real implementation this serializes the requests into a
+        # SettlementStream request frame, signs the serialized bytes in
+        # place (client._sign_frame) and appends the _frame_checksum trailer
+        # before writing.
+        await self._rpc.write(requests)
+
+    async def close(self) -> None:
+        """Close the stream and stop the reader."""
+        self._closed = True
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
+    async def _read_loop(self) -> None:
+        """
+        Read response frames and resolve waiting senders.
+
+        On stream failure, reconnects with exponential backoff; after
+        _STREAM_RECONNECT_ATTEMPTS consecutive failures the stream is marked
+        closed and all in-flight sends are failed.
+        """
+        backoff_s = _STREAM_BACKOFF_BASE_S
+        failures = 0
+
+        while not self._closed:
+            try:
+                assert self._rpc is not None
+                frame = await self._rpc.read()
+                backoff_s = _STREAM_BACKOFF_BASE_S
+                failures = 0
+                self._dispatch_frame(frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                if failures >= _STREAM_RECONNECT_ATTEMPTS:
+                    logger.error("Settlement stream failed permanently: %s", e)
+                    self._closed = True
+                    self._client._fail_in_flight(
+                        ConnectionError("Settlement stream lost", cause=e)
+                    )
+                    return
+                logger.warning(
+                    "Settlement stream error (%s), reconnecting in %ss", e, backoff_s
+                )
+                await asyncio.sleep(backoff_s)
+                backoff_s = min(backoff_s * 2, _STREAM_BACKOFF_MAX_S)
+                try:
+                    self._rpc = await self._client._open_stream(self._channel)
+                except Exception as reopen_error:
+                    logger.warning("Stream reconnect failed: %s", reopen_error)
+
+    def _dispatch_frame(self, settlement: Settlement) -> None:
+        """
+        Route a response frame to its waiting sender or the push path.
+
+        Frames matching a pending idempotency_key resolve that send's future;
+        anything else is a coordinator push for an incoming settlement.
+        """
+        settlement = self._client._intern_settlement(settlement)
+        future = self._client._pending.pop(settlement.idempotency_key, None)
+        if future is not None:
+            if not future.done():
+                future.set_result(settlement)
+        else:
+            self._client._handle_incoming_settlement(settlement)
+
+
+class _ChannelPool:
+    """
+    Round-robin pool of coordinator channels.
+
+    A single HTTP/2 connection serializes concurrent RPCs behind one TCP
+    congestion window and flow-control budget; spreading calls over a small
+    pool avoids that head-of-line blocking. Channels that have gone idle or
+    are near the HTTP/2 concurrent-stream limit are transparently recreated.
+    """
+
+    def __init__(self, factory: Callable[[], _Channel], size: int):
+        self._factory = factory
+        self._channels = [factory() for _ in range(size)]
+        self._rr = itertools.count()
+
+    @property
+    def channels(self) -> list[_Channel]:
+        """Get the channels currently in the pool."""
+        return self._channels
+
+    def next_channel(self) -> _Channel:
+        """Get the next channel in round-robin order, recreating stale ones."""
+        index = next(self._rr) % len(self._channels)
+        channel = self._channels[index]
+
+        now = time.monotonic()
+        if (
+            now - channel.last_used_at > _CHANNEL_IDLE_TTL_S
+            or channel.active_streams >= _MAX_STREAMS_PER_CHANNEL
+        ):
+            logger.debug("Recreating channel %d (idle or stream-limited)", index)
+            asyncio.ensure_future(channel.close())
+            channel = self._channels[index] = self._factory()
+
+        channel.last_used_at = now
+        return channel
+
+    async def close(self) -> None:
+        """Close all channels in the pool."""
+        for channel in self._channels:
+            await channel.close()
+        self._channels = []
+
+
+def _frame_checksum(payload: bytes | bytearray | memoryview) -> int:
+    """
+    Checksum covering a serialized wire frame.
+
+    zlib.crc32 is a tuned C implementation (hardware-accelerated in current
+    zlib builds) and takes buffer views, so framing code checksums the bytes
+    it is about to write without copying them; a pure-Python CRC would
+    dominate per-frame cost.
+    """
+    return zlib.crc32(payload)
+
+
+@singledispatch
+def _as_money(amount: object, currency: Optional[Currency]) -> Money:
+    """
+    Coerce a send() amount to Money, dispatching on the amount's type.
+
+    singledispatch caches the resolved implementation per type, so the hot
+    send path skips the isinstance chain after the first call for each type.
+    """
+    raise ValidationError(
+        f"Unsupported amount type: {type(amount).__name__}", field="amount"
+    )
+
+
+@_as_money.register
+def _(amount: Money, currency: Optional[Currency]) -> Money:
+    return amount
+
+
+@_as_money.register
+def _(amount: Decimal, currency: Optional[Currency]) -> Money:
+    if currency is None:
+        raise ValidationError("Currency is required when amount is Decimal", field="currency")
+    return Money(value=amount, currency=currency)
+
+
+def _idempotency_keys() -> Iterator[str]:
+    """
+    Yield random version-4 UUID strings from batched entropy.
+
+    uuid4() draws 16 bytes from os.urandom on every call; on a busy send
+    path that is one syscall per settlement. Drawing a 4 KiB block at a time
+    and slicing it into keys amortizes the syscall while keeping every key
+    fully random and unique.
+    """
+    while True:
+        block = os.urandom(16 * 256)
+        for i in range(0, len(block), 16):
+            yield str(UUID(bytes=block[i : i + 16], version=4))
+
+
+_key_source = _idempotency_keys()
+
+
+def _reset_key_source() -> None:
+    """Discard buffered entropy so forked children don't replay parent keys."""
+    global _key_source
+    _key_source = _idempotency_keys()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_key_source)
+
+
+class _PendingSend(NamedTuple):
+    """A send() call waiting to be coalesced into a batch submission."""
+
+    request: SettlementRequest
+    future: asyncio.Future[Settlement]
+
 
 class AtomicSettleClient:
     """
@@ -63,6 +361,10 @@ class AtomicSettleClient:
         key_path: Optional[str] = None,
         ca_cert_path: Optional[str] = None,
         timeout_ms: int = 30000,
+        max_batch: int = 512,
+        max_linger_ms: float = 2.0,
+        pool_size: int = 4,
+        warm_on_connect: bool = True,
     ):
         """
         Initialize AtomicSettle client.
@@ -75,6 +377,13 @@ class AtomicSettleClient:
             key_path: Path to client TLS private key
             ca_cert_path: Path to CA certificate for coordinator
             timeout_ms: Default timeout for operations in milliseconds
+            max_batch: Maximum number of sends coalesced into one coordinator
+                submission
+            max_linger_ms: How long the batcher waits for more sends before
+                flushing a partial batch
+            pool_size: Number of coordinator channels to spread RPCs across
+            warm_on_connect: Open streams on all channels during connect() so
+                the first send doesn't pay handshake latency
         """
         self.participant_id = participant_id
         self.coordinator_url = coordinator_url
@@ -83,9 +392,27 @@ class AtomicSettleClient:
         self.key_path = key_path
         self.ca_cert_path = ca_cert_path
         self.timeout_ms = timeout_ms
+        self.max_batch = max_batch
+        self.max_linger_ms = max_linger_ms
+        self.pool_size = pool_size
+        self.warm_on_connect = warm_on_connect
 
         self._connected = False
+        self._pool: Optional[_ChannelPool] = None
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._signer: Optional[Ed25519PrivateKey] = None
         self._incoming_handlers: list[Callable[[Settlement], None]] = []
+        self._batch_queue: Optional[asyncio.Queue[_PendingSend]] = None
+        self._batch_task: Optional[asyncio.Task[None]] = None
+        self._dispatch_queue: Optional[asyncio.Queue[Settlement]] = None
+        self._dispatch_task: Optional[asyncio.Task[None]] = None
+        self._pending: dict[str, asyncio.Future[Settlement]] = {}
+        self._single_flight: dict[str, asyncio.Future[Settlement]] = {}
+        self._push_queues: list[asyncio.Queue[Settlement]] = []
+        self._settlement_cache: OrderedDict[str, Settlement] = OrderedDict()
+        self._stream_cursor: Optional[str] = None
+        self._dropped_incoming = 0
+        self._envelope_template: dict[str, str] = {}
 
     @property
     def is_connected(self) -> bool:
@@ -99,20 +426,47 @@ class AtomicSettleClient:
         Raises:
             ConnectionError: If connection fails
         """
+        if self._connected:
+            return
+
         logger.info(
-            f"Connecting to coordinator at {self.coordinator_url} as {self.participant_id}"
+            "Connecting to coordinator at %s as %s", self.coordinator_url, self.participant_id
         )
 
         try:
             # In a real implementation:
-            # 1. Establish gRPC/TLS connection
-            # 2. Perform handshake
-            # 3. Authenticate with certificate
-            # 4. Start heartbeat loop
-
+            # 1. Perform handshake on the first channel
+            # 2. Authenticate with certificate
+            # 3. Start heartbeat loop
+
+            self._ssl_context = self._build_ssl_context()
+            if self.signing_key is not None:
+                self._signer = self._load_signer()
+
+            # The envelope fields that never change for this client are built
+            # once here; per-message encoding only fills in message_id,
+            # correlation_id and timestamp instead of rebuilding the whole
+            # MessageEnvelope from scratch for every request.
+            self._envelope_template = {
+                "version": _PROTOCOL_VERSION,
+                "signer_id": self.participant_id,
+            }
+            self._pool = _ChannelPool(self._open_channel, self.pool_size)
             self._connected = True
-            logger.info(f"Connected to coordinator as {self.participant_id}")
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._drain_batches())
+            self._dispatch_queue = asyncio.Queue(maxsize=_DISPATCH_QUEUE_SIZE)
+            self._dispatch_task = asyncio.create_task(self._dispatch_incoming())
+
+            if self.warm_on_connect:
+                await asyncio.gather(
+                    *(self._warm_channel(c) for c in self._pool.channels)
+                )
+
+            logger.info("Connected to coordinator as %s", self.participant_id)
 
+        except AtomicSettleError:
+            raise
         except Exception as e:
             raise ConnectionError(f"Failed to connect: {e}", cause=e)
 
@@ -121,7 +475,7 @@ class AtomicSettleClient:
         if not self._connected:
             return
 
-        logger.info(f"Disconnecting from coordinator")
+        logger.info("Disconnecting from coordinator")
 
         try:
             # In a real implementation:
@@ -129,11 +483,24 @@ class AtomicSettleClient:
             # 2. Close connection
             # 3. Stop heartbeat loop
 
+            await self._stop_task(self._batch_task)
+            self._batch_task = None
+            await self._stop_task(self._dispatch_task)
+            self._dispatch_task = None
+            self._dispatch_queue = None
+            self._fail_pending_sends(ConnectionError("Client disconnected"))
+            self._fail_in_flight(ConnectionError("Client disconnected"))
+            self._batch_queue = None
+
+            if self._pool is not None:
+                await self._pool.close()
+                self._pool = None
+
             self._connected = False
             logger.info("Disconnected from coordinator")
 
         except Exception as e:
-            logger.error(f"Error during disconnect: {e}")
+            logger.error("Error during disconnect: %s", e)
             self._connected = False
 
     async def send(
@@ -147,10 +514,18 @@ class AtomicSettleClient:
         idempotency_key: Optional[str] = None,
         wait_for_completion: bool = True,
         timeout_ms: Optional[int] = None,
+        batch: bool = True,
     ) -> Settlement:
         """
         Send a settlement to another participant.
 
+        Concurrent send() calls are coalesced into a single coordinator
+        submission (signed once, one round-trip) to amortize signing and RPC
+        overhead. Pass ``batch=False`` for latency-critical sends that should
+        not wait for the batcher's linger window. Concurrent calls carrying
+        the same idempotency_key collapse to one in-flight submission and all
+        resolve with the same Settlement.
+
         Args:
             to_participant: Destination participant ID
             amount: Amount to send (Money object or Decimal)
@@ -161,6 +536,7 @@ class AtomicSettleClient:
             idempotency_key: Unique key for duplicate detection
             wait_for_completion: Wait for settlement to complete
             timeout_ms: Timeout in milliseconds (overrides default)
+            batch: Allow this send to be coalesced with concurrent sends
 
         Returns:
             Settlement object with current status
@@ -172,17 +548,11 @@ class AtomicSettleClient:
         """
         self._ensure_connected()
 
-        # Build Money object
-        if isinstance(amount, Money):
-            money = amount
-        elif currency is not None:
-            money = Money(value=amount, currency=currency)
-        else:
-            raise ValidationError("Currency is required when amount is Decimal", field="currency")
+        money = _as_money(amount, currency)
 
         # Generate idempotency key if not provided
         if idempotency_key is None:
-            idempotency_key = str(uuid4())
+            idempotency_key = next(_key_source)
 
         # Validate request
         if not to_participant:
@@ -195,8 +565,10 @@ class AtomicSettleClient:
             )
 
         logger.info(
-            f"Sending settlement: {money} to {to_participant} "
-            f"(idempotency_key={idempotency_key})"
+            "Sending settlement: %s to %s (idempotency_key=%s)",
+            money,
+            to_participant,
+            idempotency_key,
         )
 
         request = SettlementRequest(
@@ -208,14 +580,89 @@ class AtomicSettleClient:
             idempotency_key=idempotency_key,
         )
 
-        # In a real implementation:
-        # 1. Sign request
-        # 2. Send to coordinator
-        # 3. Wait for response
-        # 4. If wait_for_completion, poll until final state
+        effective_timeout_ms = timeout_ms if timeout_ms is not None else self.timeout_ms
+
+        # Single-flight: concurrent sends carrying the same idempotency key
+        # share one in-flight submission instead of each paying a round-trip
+        # the coordinator would dedupe anyway.
+        existing = self._single_flight.get(idempotency_key)
+        if existing is not None:
+            logger.debug("Joining in-flight send (idempotency_key=%s)", idempotency_key)
+            try:
+                return await asyncio.wait_for(
+                    asyncio.shield(existing), effective_timeout_ms / 1000
+                )
+            except asyncio.TimeoutError:
+                raise TimeoutError("send", effective_timeout_ms)
+
+        flight: asyncio.Future[Settlement] = asyncio.get_running_loop().create_future()
+        self._single_flight[idempotency_key] = flight
+        try:
+            settlement = await self._send_request(
+                request,
+                wait_for_completion=wait_for_completion,
+                timeout_ms=effective_timeout_ms,
+                batch=batch,
+            )
+        except Exception as e:
+            flight.set_exception(e)
+            flight.exception()  # consumed here; there may be no followers
+            raise
+        else:
+            flight.set_result(settlement)
+            return settlement
+        finally:
+            self._single_flight.pop(idempotency_key, None)
+            if not flight.done():
+                # The leading send was cancelled; release any followers.
+                flight.cancel()
+
+    async def _send_request(
+        self,
+        request: SettlementRequest,
+        wait_for_completion: bool,
+        timeout_ms: int,
+        batch: bool,
+    ) -> Settlement:
+        """Submit one settlement request, batched with concurrent sends when allowed."""
+        if batch and wait_for_completion and self._batch_queue is not None:
+            future: asyncio.Future[Settlement] = asyncio.get_running_loop().create_future()
+            self._batch_queue.put_nowait(_PendingSend(request=request, future=future))
+            try:
+                return await asyncio.wait_for(future, timeout_ms / 1000)
+            except asyncio.TimeoutError:
+                raise TimeoutError("send", timeout_ms)
+
+        settlements = await self._submit_batch(
+            [request],
+            wait_for_completion=wait_for_completion,
+            timeout_ms=timeout_ms,
+        )
+        return settlements[0]
+
+    async def send_many(self, requests: Sequence[SettlementRequest]) -> list[Settlement]:
+        """
+        Send multiple settlements in a single coordinator submission.
 
-        # Placeholder: Return mock settlement
-        raise NotImplementedError("Settlement sending not yet implemented")
+        All requests are signed once over the batch and sent in one
+        round-trip, amortizing signature and RPC overhead. Use this when the
+        caller already has settlements in hand; concurrent send() calls are
+        batched automatically.
+
+        Args:
+            requests: Settlement requests to submit
+
+        Returns:
+            List of Settlement objects, one per request, in request order
+        """
+        self._ensure_connected()
+
+        if not requests:
+            return []
+
+        logger.info("Sending batch of %d settlements", len(requests))
+
+        return await self._submit_batch(list(requests), timeout_ms=self.timeout_ms)
 
     async def get_balance(self, currency: Currency) -> Balance:
         """
@@ -229,10 +676,12 @@ class AtomicSettleClient:
         """
         self._ensure_connected()
 
-        logger.debug(f"Querying balance for {currency.value}")
+        logger.debug("Querying balance for %s", currency.value)
+
+        self._next_channel()
 
         # In a real implementation:
-        # 1. Send balance query to coordinator
+        # 1. Send balance query to coordinator over the selected channel
         # 2. Return response
 
         raise NotImplementedError("Balance query not yet implemented")
@@ -241,21 +690,31 @@ class AtomicSettleClient:
         """
         Get balances for all currencies.
 
+        Per-currency queries are issued concurrently (bounded to 10 in
+        flight) so the wall-clock cost is one round-trip rather than one per
+        currency.
+
         Returns:
-            List of Balance objects
+            List of Balance objects, in Currency declaration order
         """
         self._ensure_connected()
 
-        # In a real implementation:
-        # 1. Send balance query for all currencies
-        # 2. Return responses
+        semaphore = asyncio.Semaphore(10)
 
-        raise NotImplementedError("Balance query not yet implemented")
+        async def query(currency: Currency) -> Balance:
+            async with semaphore:
+                return await self.get_balance(currency)
+
+        return await asyncio.gather(*(query(c) for c in Currency))
 
     async def get_settlement(self, settlement_id: str) -> Settlement:
         """
         Get settlement by ID.
 
+        Final settlements are served from a local LRU cache: once SETTLED,
+        REJECTED or FAILED they never change, so re-querying the coordinator
+        is wasted round-trips for polling callers.
+
         Args:
             settlement_id: Settlement ID to query
 
@@ -264,10 +723,17 @@ class AtomicSettleClient:
         """
         self._ensure_connected()
 
-        logger.debug(f"Querying settlement {settlement_id}")
+        cached = self._settlement_cache.get(settlement_id)
+        if cached is not None:
+            self._settlement_cache.move_to_end(settlement_id)
+            return cached
+
+        logger.debug("Querying settlement %s", settlement_id)
+
+        self._next_channel()
 
         # In a real implementation:
-        # 1. Send settlement query to coordinator
+        # 1. Send settlement query to coordinator over the selected channel
         # 2. Return response
 
         raise NotImplementedError("Settlement query not yet implemented")
@@ -276,29 +742,69 @@ class AtomicSettleClient:
         self,
         status: Optional[SettlementStatus] = None,
         limit: int = 100,
-        offset: int = 0,
+        after_id: Optional[str] = None,
     ) -> list[Settlement]:
         """
         List settlements with optional filtering.
 
+        Pagination is keyset-based: pass the id of the last settlement from
+        the previous page as after_id. Unlike an offset, a cursor query costs
+        the coordinator O(page) regardless of how deep the caller has paged,
+        and the status filter is applied server-side so filtered-out rows
+        never cross the wire. Use iter_settlements to page automatically.
+
         Args:
             status: Filter by status
-            limit: Maximum number of results
-            offset: Offset for pagination
+            limit: Maximum number of results per page
+            after_id: Return settlements after this id (None starts from the
+                beginning)
 
         Returns:
             List of Settlement objects
         """
         self._ensure_connected()
 
-        logger.debug(f"Listing settlements (status={status}, limit={limit}, offset={offset})")
+        logger.debug(
+            "Listing settlements (status=%s, limit=%d, after_id=%s)", status, limit, after_id
+        )
+
+        self._next_channel()
 
         # In a real implementation:
-        # 1. Send list query to coordinator
+        # 1. Send a keyset list query (id > after_id, status filter applied
+        #    server-side) to the coordinator over the selected channel
         # 2. Return responses
 
         raise NotImplementedError("Settlement listing not yet implemented")
 
+    async def iter_settlements(
+        self,
+        status: Optional[SettlementStatus] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Settlement]:
+        """
+        Iterate settlements, advancing the pagination cursor automatically.
+
+        Args:
+            status: Filter by status
+            page_size: Settlements fetched per coordinator round-trip
+
+        Yields:
+            Settlement objects in listing order
+        """
+        self._ensure_connected()
+
+        after_id: Optional[str] = None
+        while True:
+            page = await self.list_settlements(
+                status=status, limit=page_size, after_id=after_id
+            )
+            for settlement in page:
+                yield settlement
+            if len(page) < page_size:
+                return
+            after_id = str(page[-1].id)
+
     def on_incoming(self, handler: Callable[[Settlement], None]) -> None:
         """
         Register handler for incoming settlements.
@@ -307,22 +813,63 @@ class AtomicSettleClient:
             handler: Callback function that receives Settlement objects
         """
         self._incoming_handlers.append(handler)
-        logger.debug(f"Registered incoming settlement handler")
+        logger.debug("Registered incoming settlement handler")
 
-    async def stream_settlements(self) -> AsyncIterator[Settlement]:
+    async def stream_settlements(
+        self,
+        status: Optional[SettlementStatus] = None,
+        cursor: Optional[str] = None,
+    ) -> AsyncIterator[Settlement]:
         """
         Stream incoming settlement notifications.
 
+        Notifications are pushed by the coordinator over the same persistent
+        settlement stream used for sends, so no extra subscription RPC is
+        opened. The status filter and resume cursor travel in the
+        subscription frame: filtering happens server-side (unwanted
+        notifications never cross the wire) and after a restart the
+        coordinator replays from the cursor instead of the client re-fetching
+        history via list_settlements.
+
+        Args:
+            status: Only yield settlements in this status
+            cursor: Resume after this position (see stream_cursor); None
+                streams from now on
+
         Yields:
             Settlement objects as they arrive
         """
         self._ensure_connected()
 
-        # In a real implementation:
-        # 1. Subscribe to settlement notifications
-        # 2. Yield settlements as they arrive
+        channel = self._next_channel()
+        await self._stream_for(channel)
 
-        raise NotImplementedError("Settlement streaming not yet implemented")
+        # In a real implementation a subscription frame carrying the status
+        # filter and resume cursor is written to the stream here.
+
+        queue: asyncio.Queue[Settlement] = asyncio.Queue(maxsize=_DISPATCH_QUEUE_SIZE)
+        self._push_queues.append(queue)
+        try:
+            while True:
+                settlement = await queue.get()
+                if status is not None and settlement.status is not status:
+                    # Defensive client-side filter; the coordinator already
+                    # filters server-side once the subscription frame lands.
+                    continue
+                self._stream_cursor = str(settlement.id)
+                yield settlement
+        finally:
+            self._push_queues.remove(queue)
+
+    @property
+    def stream_cursor(self) -> Optional[str]:
+        """
+        Get the position of the last settlement yielded by stream_settlements.
+
+        Persist this and pass it back as cursor= after a restart to resume
+        the stream without re-fetching already-seen settlements.
+        """
+        return self._stream_cursor
 
     async def __aenter__(self) -> AtomicSettleClient:
         """Async context manager entry."""
@@ -338,13 +885,332 @@ class AtomicSettleClient:
         if not self._connected:
             raise ConnectionError("Not connected to coordinator")
 
-    def _handle_incoming_settlement(self, settlement: Settlement) -> None:
-        """Handle incoming settlement notification."""
-        for handler in self._incoming_handlers:
+    def _load_signer(self) -> Ed25519PrivateKey:
+        """Load the Ed25519 signer from the configured signing key bytes."""
+        assert self.signing_key is not None
+        if self.signing_key.startswith(b"-----"):
+            key = serialization.load_pem_private_key(self.signing_key, password=None)
+            if not isinstance(key, Ed25519PrivateKey):
+                raise AuthenticationError("Signing key must be an Ed25519 private key")
+            return key
+        return Ed25519PrivateKey.from_private_bytes(self.signing_key)
+
+    def _sign_frame(self, payload: bytes | bytearray | memoryview) -> bytes:
+        """
+        Sign serialized wire bytes directly.
+
+        The signature covers the exact bytes that go on the stream: callers
+        hand over the already-serialized frame (a memoryview slice works,
+        nothing is copied) instead of re-serializing the message into a
+        canonical form just to sign it.
+
+        Returns:
+            64-byte Ed25519 signature
+
+        Raises:
+            AuthenticationError: If no signing key was configured
+        """
+        if self._signer is None:
+            raise AuthenticationError("No signing key configured")
+        return self._signer.sign(payload)
+
+    def _build_ssl_context(self) -> ssl.SSLContext:
+        """
+        Build the TLS context shared by every pooled channel.
+
+        One context means one TLS session cache: handshakes after the first
+        resume a cached session (one round-trip, no key exchange) instead of
+        each channel negotiating from scratch.
+        """
+        context = ssl.create_default_context(
+            ssl.Purpose.SERVER_AUTH, cafile=self.ca_cert_path
+        )
+        if self.cert_path and self.key_path:
+            context.load_cert_chain(self.cert_path, self.key_path)
+        return context
+
+    def _open_channel(self) -> _Channel:
+        """Open a new channel to the coordinator."""
+        # In a real implementation this builds a grpc.aio.Channel using the
+        # shared self._ssl_context credentials.
+        return _Channel(self.coordinator_url)
+
+    async def _warm_channel(self, channel: _Channel) -> None:
+        """
+        Warm a channel during connect: handshake and settlement stream are
+        opened eagerly and in parallel with the other channels.
+
+        Best-effort: a channel that fails to warm is left cold and the first
+        send on it surfaces the error.
+        """
+        try:
+            await self._stream_for(channel)
+        except Exception as e:
+            logger.debug("Channel warm-up skipped: %s", e)
+
+    async def _open_stream(self, channel: _Channel) -> _StreamRpc:
+        """
+        Open the long-lived SettlementStream RPC on a channel.
+
+        Returns:
+            A bidirectional stream call supporting async read() and write()
+        """
+        # In a real implementation: return coordinator_stub.SettlementStream()
+
+        raise NotImplementedError("Settlement streaming not yet implemented")
+
+    async def _stream_for(self, channel: _Channel) -> _SettlementStream:
+        """Get the persistent settlement stream for a channel, opening it lazily."""
+        if channel.stream is None or channel.stream.closed:
+            stream = _SettlementStream(self, channel)
+            await stream.open()
+            channel.stream = stream
+        return channel.stream
+
+    def _intern_settlement(self, settlement: Settlement) -> Settlement:
+        """
+        Collapse duplicate decoded settlements onto one instance.
+
+        Streams re-deliver the same final settlement (response frame plus
+        push, or replays after reconnect); handing every consumer the cached
+        instance lets the freshly decoded duplicate -- its legs, timing and
+        Money objects included -- be freed immediately instead of N copies
+        accumulating across handlers and queues.
+        """
+        cached = self._settlement_cache.get(str(settlement.id))
+        if cached is not None and cached.status is settlement.status:
+            return cached
+        self._cache_settlement(settlement)
+        return settlement
+
+    def _cache_settlement(self, settlement: Settlement) -> None:
+        """Remember a final settlement for get_settlement lookups."""
+        if not settlement.status.is_final:
+            return
+        cache = self._settlement_cache
+        key = str(settlement.id)
+        cache[key] = settlement
+        cache.move_to_end(key)
+        while len(cache) > _SETTLEMENT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _fail_in_flight(self, error: AtomicSettleError) -> None:
+        """Fail all sends awaiting a response frame."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+                # A sender that already gave up (cancelled/timed out) leaves
+                # its future unawaited; mark the exception retrieved so
+                # shutdown doesn't log "exception was never retrieved".
+                future.exception()
+
+    def _next_channel(self) -> _Channel:
+        """Pick the channel for the next RPC in round-robin order."""
+        if self._pool is None:
+            raise ConnectionError("Not connected to coordinator")
+        return self._pool.next_channel()
+
+    async def _drain_batches(self) -> None:
+        """
+        Coalesce queued sends into batch submissions.
+
+        Waits for the first pending send, then collects more until either
+        max_batch entries are queued or max_linger_ms has elapsed, and
+        submits them as one signed batch.
+        """
+        assert self._batch_queue is not None
+        queue = self._batch_queue
+        linger_s = self.max_linger_ms / 1000
+
+        while True:
+            pending: list[_PendingSend] = []
             try:
-                handler(settlement)
+                pending.append(await queue.get())
+                deadline = asyncio.get_running_loop().time() + linger_s
+
+                while len(pending) < self.max_batch:
+                    remaining = deadline - asyncio.get_running_loop().time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        pending.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                logger.debug("Flushing batch of %d settlements", len(pending))
+
+                settlements = await self._submit_batch(
+                    [p.request for p in pending], timeout_ms=self.timeout_ms
+                )
+            except asyncio.CancelledError:
+                error = ConnectionError("Client disconnected")
+                for p in pending:
+                    if not p.future.done():
+                        p.future.set_exception(error)
+                raise
             except Exception as e:
-                logger.error(f"Error in incoming settlement handler: {e}")
+                for p in pending:
+                    if not p.future.done():
+                        p.future.set_exception(e)
+            else:
+                for p, settlement in zip(pending, settlements):
+                    if not p.future.done():
+                        p.future.set_result(settlement)
+
+    async def _submit_batch(
+        self,
+        requests: list[SettlementRequest],
+        wait_for_completion: bool = True,
+        timeout_ms: Optional[int] = None,
+    ) -> list[Settlement]:
+        """
+        Submit a batch of settlement requests in one coordinator round-trip.
+
+        Returns:
+            Settlement objects in the same order as the requests
+        """
+        channel = self._next_channel()
+        stream = await self._stream_for(channel)
+
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[Settlement]] = []
+        keys: list[str] = []
+        for request in requests:
+            if request.idempotency_key is None:
+                request.idempotency_key = next(_key_source)
+            key = request.idempotency_key
+            future: asyncio.Future[Settlement] = loop.create_future()
+            self._pending[key] = future
+            futures.append(future)
+            keys.append(key)
+
+        try:
+            # In a real implementation the frame envelope starts from the
+            # prebuilt _envelope_template and the frame is signed once over
+            # the Merkle root of the batch before being written to the stream.
+            await stream.send_requests(requests)
+        except Exception:
+            for key in keys:
+                self._pending.pop(key, None)
+            raise
+
+        if timeout_ms is not None:
+            try:
+                settlements: list[Settlement] = await asyncio.wait_for(
+                    asyncio.gather(*futures), timeout_ms / 1000
+                )
+                return settlements
+            except asyncio.TimeoutError:
+                # The cancelled futures stay in _pending so a late response
+                # frame is absorbed and dropped rather than mistaken for a
+                # coordinator push.
+                raise TimeoutError("send", timeout_ms)
+        return list(await asyncio.gather(*futures))
+
+    @staticmethod
+    async def _stop_task(task: Optional[asyncio.Task[None]]) -> None:
+        """Cancel a background task and wait for it to finish."""
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _fail_pending_sends(self, error: AtomicSettleError) -> None:
+        """Fail any sends still queued for batching."""
+        if self._batch_queue is None:
+            return
+        while not self._batch_queue.empty():
+            pending = self._batch_queue.get_nowait()
+            if not pending.future.done():
+                pending.future.set_exception(error)
+
+    def _handle_incoming_settlement(self, settlement: Settlement) -> None:
+        """
+        Handle incoming settlement notification.
+
+        Runs on the stream reader path, so it only enqueues: user handlers
+        execute on a dedicated dispatcher task where a slow or crashing
+        handler cannot stall frame reads. Full queues shed their oldest
+        entry rather than blocking the reader or growing unboundedly.
+        """
+        for queue in self._push_queues:
+            self._offer_settlement(queue, settlement)
+        if self._dispatch_queue is not None:
+            self._offer_settlement(self._dispatch_queue, settlement)
+
+    def _offer_settlement(
+        self, queue: asyncio.Queue[Settlement], settlement: Settlement
+    ) -> None:
+        """Enqueue a notification, dropping the oldest entry on overflow."""
+        while True:
+            try:
+                queue.put_nowait(settlement)
+                return
+            except asyncio.QueueFull:
+                try:
+                    queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    continue
+                self._dropped_incoming += 1
+                logger.warning(
+                    "Incoming-settlement queue full; dropped oldest notification "
+                    "(%d dropped total)",
+                    self._dropped_incoming,
+                )
+
+    @property
+    def dropped_incoming(self) -> int:
+        """
+        Get the number of incoming notifications shed due to queue overflow.
+
+        Non-zero means a handler or stream_settlements consumer fell behind a
+        burst; the shed settlements are recoverable via list_settlements.
+        """
+        return self._dropped_incoming
+
+    async def _dispatch_incoming(self) -> None:
+        """Run registered incoming-settlement handlers off the receive path."""
+        assert self._dispatch_queue is not None
+        queue = self._dispatch_queue
+        while True:
+            settlement = await queue.get()
+            for handler in self._incoming_handlers:
+                try:
+                    handler(settlement)
+                except Exception as e:
+                    logger.error("Error in incoming settlement handler: %s", e)
+
+
+def install_uvloop() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy, if available.
+
+    uvloop's libuv-based loop roughly halves asyncio's per-operation
+    overhead, which adds up across the SDK's stream reader, batcher and
+    dispatcher tasks. The SDK never changes the loop policy on import --
+    that is the application's call -- so invoke this before starting the
+    event loop:
+
+        >>> from atomicsettle import install_uvloop
+        >>> install_uvloop()
+        >>> asyncio.run(main())
+
+    uvloop ships in the "speed" extra (pip install atomicsettle[speed]).
+
+    Returns:
+        True if uvloop was installed, False if it is not available
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available; keeping default event loop policy")
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
 
 
 def load_key(path: str) -> bytes:
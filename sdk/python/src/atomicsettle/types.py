@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
@@ -10,6 +11,11 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+# Leaf types on the hot decode path (constructed per streamed settlement) are
+# plain frozen dataclasses with slots: no validation machinery and no
+# per-instance __dict__. Pydantic models are kept for the types that carry
+# untrusted user input into the API (SettlementRequest and friends).
+
 
 class Currency(str, Enum):
     """ISO 4217 currency codes."""
@@ -30,11 +36,17 @@ class Currency(str, Enum):
     @property
     def decimal_places(self) -> int:
         """Get standard decimal places for this currency."""
-        if self in (Currency.JPY,):
+        if self in _ZERO_DECIMAL_CURRENCIES:
             return 0
         return 2
 
 
+# Currencies settled in whole units; everything else in the enum uses two
+# decimal places. Built once so decimal_places is a hash lookup rather than a
+# tuple scan -- it runs for every Money.minor_units conversion.
+_ZERO_DECIMAL_CURRENCIES = frozenset({Currency.JPY})
+
+
 class SettlementStatus(str, Enum):
     """Settlement lifecycle status."""
 
@@ -52,16 +64,23 @@ class SettlementStatus(str, Enum):
     @property
     def is_final(self) -> bool:
         """Check if this is a final state."""
-        return self in (
-            SettlementStatus.SETTLED,
-            SettlementStatus.REJECTED,
-            SettlementStatus.FAILED,
-        )
+        return self in _FINAL_STATUSES
 
     @property
     def is_success(self) -> bool:
         """Check if this is a successful final state."""
-        return self == SettlementStatus.SETTLED
+        return self is SettlementStatus.SETTLED
+
+
+# Built once so is_final is a hash lookup rather than a tuple construction
+# and linear scan per call (it runs for every streamed status update).
+_FINAL_STATUSES = frozenset(
+    {
+        SettlementStatus.SETTLED,
+        SettlementStatus.REJECTED,
+        SettlementStatus.FAILED,
+    }
+)
 
 
 class FxMode(str, Enum):
@@ -72,7 +91,23 @@ class FxMode(str, Enum):
     AT_COORDINATOR = "AT_COORDINATOR"
 
 
-class Money(BaseModel):
+def _to_decimal(amount: Decimal | str | int | float) -> Decimal:
+    """
+    Convert a constructor-helper amount to Decimal.
+
+    Decimal passes through untouched and str/int convert directly; only
+    float takes the str() detour, which keeps 0.1 reading as "0.1" instead
+    of the 55-digit binary expansion Decimal(0.1) would faithfully preserve.
+    """
+    if isinstance(amount, Decimal):
+        return amount
+    if isinstance(amount, float):
+        return Decimal(str(amount))
+    return Decimal(amount)
+
+
+@dataclass(frozen=True, slots=True)
+class Money:
     """Monetary amount with currency."""
 
     value: Decimal
@@ -81,6 +116,35 @@ class Money(BaseModel):
     def __str__(self) -> str:
         return f"{self.value} {self.currency.value}"
 
+    @property
+    def minor_units(self) -> int:
+        """
+        Get the amount as an integer count of minor units (cents for USD,
+        whole yen for JPY).
+
+        Integer minor units are the cheap representation for hot aggregation
+        loops and the wire encode path; convert once, sum as ints, and
+        rebuild with from_minor_units.
+
+        Raises:
+            ValueError: If the amount is not a whole number of minor units
+        """
+        scaled = self.value.scaleb(self.currency.decimal_places)
+        units = int(scaled)
+        if units != scaled:
+            raise ValueError(
+                f"{self.value} {self.currency.value} is not a whole number of minor units"
+            )
+        return units
+
+    @classmethod
+    def from_minor_units(cls, minor_units: int, currency: Currency) -> Money:
+        """Create from an integer count of minor units."""
+        return cls(
+            value=Decimal(minor_units).scaleb(-currency.decimal_places),
+            currency=currency,
+        )
+
     def __add__(self, other: Money) -> Money:
         if self.currency != other.currency:
             raise ValueError(f"Cannot add {self.currency} and {other.currency}")
@@ -94,32 +158,43 @@ class Money(BaseModel):
     @classmethod
     def usd(cls, amount: Decimal | str | int | float) -> Money:
         """Create USD amount."""
-        return cls(value=Decimal(str(amount)), currency=Currency.USD)
+        return cls(value=_to_decimal(amount), currency=Currency.USD)
 
     @classmethod
     def eur(cls, amount: Decimal | str | int | float) -> Money:
         """Create EUR amount."""
-        return cls(value=Decimal(str(amount)), currency=Currency.EUR)
+        return cls(value=_to_decimal(amount), currency=Currency.EUR)
 
 
-class Balance(BaseModel):
-    """Account balance information."""
+@dataclass(frozen=True, slots=True)
+class Balance:
+    """
+    Account balance information.
 
-    currency: Currency
-    available: Decimal = Field(description="Available for settlement")
-    locked: Decimal = Field(description="Reserved for pending settlements")
-    pending_in: Decimal = Field(description="Incoming (not yet final)")
-    pending_out: Decimal = Field(description="Outgoing (not yet final)")
-
-    @property
-    def total(self) -> Decimal:
-        """Get total balance (available + locked)."""
-        return self.available + self.locked
+    Attributes:
+        available: Available for settlement
+        locked: Reserved for pending settlements
+        pending_in: Incoming (not yet final)
+        pending_out: Outgoing (not yet final)
+        total: Total balance (available + locked)
+        projected: Projected balance including pending
+    """
 
-    @property
-    def projected(self) -> Decimal:
-        """Get projected balance including pending."""
-        return self.total + self.pending_in - self.pending_out
+    currency: Currency
+    available: Decimal
+    locked: Decimal
+    pending_in: Decimal
+    pending_out: Decimal
+    # Derived once at construction; instances are frozen, so recomputing per
+    # access in liquidity-monitoring loops would be wasted work.
+    total: Decimal = field(init=False)
+    projected: Decimal = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "total", self.available + self.locked)
+        object.__setattr__(
+            self, "projected", self.total + self.pending_in - self.pending_out
+        )
 
 
 class FxInstruction(BaseModel):
@@ -130,7 +205,8 @@ class FxInstruction(BaseModel):
     rate_reference: Optional[str] = None
 
 
-class FxRate(BaseModel):
+@dataclass(frozen=True, slots=True)
+class FxRate:
     """FX rate between two currencies."""
 
     base_currency: Currency
@@ -141,14 +217,16 @@ class FxRate(BaseModel):
     quoted_at: datetime
     valid_until: datetime
     source: str
+    # Spread in basis points, derived once at construction (rates are frozen
+    # and spread_bps is read on every pricing decision against the quote).
+    spread_bps: Decimal = field(init=False)
 
-    @property
-    def spread_bps(self) -> Decimal:
-        """Get spread in basis points."""
-        return ((self.ask - self.bid) / self.mid) * 10000
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "spread_bps", ((self.ask - self.bid) / self.mid) * 10000)
 
 
-class SettlementTiming(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SettlementTiming:
     """Timing metrics for a settlement."""
 
     initiated_at: datetime
@@ -167,7 +245,8 @@ class SettlementTiming(BaseModel):
         return None
 
 
-class SettlementLeg(BaseModel):
+@dataclass(frozen=True, slots=True)
+class SettlementLeg:
     """A single leg of a settlement."""
 
     leg_number: int
@@ -223,6 +302,27 @@ class Settlement(BaseModel):
             return None
         return self.legs[0].amount
 
+    def to_json(self) -> str:
+        """Serialize to JSON in one pass through pydantic-core's Rust serializer."""
+        return self.model_dump_json()
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> Settlement:
+        """
+        Deserialize from JSON.
+
+        Parses and validates in a single pass in pydantic-core, avoiding the
+        json.loads dict intermediate — use this for streamed settlement
+        payloads rather than model_validate(json.loads(...)).
+
+        Args:
+            data: JSON document as produced by to_json
+
+        Returns:
+            Validated Settlement
+        """
+        return cls.model_validate_json(data)
+
 
 class SettlementRequest(BaseModel):
     """Request to create a settlement."""